@@ -5,10 +5,10 @@ pansat.catalog
 The ``catalog`` module provides functionality to organize, parse and
  list local and remote files.
 """
+import os
 from pathlib import Path
 
 import numpy as np
-import xarray as xr
 
 from pansat.time import to_datetime64
 from pansat.file_record import FileRecord
@@ -43,14 +43,16 @@ class Catalog:
             A list of the filename that match the regexp of the
             product.
         """
-        folder = Path(folder)
         files = []
-        for path in folder.iterdir():
-            if path.is_dir():
-                files += self._find_files(path)
-            else:
-                if self.product.filename_regexp.match(path.name):
-                    files.append(path)
+        # Directory entries provide the file type without a separate stat
+        # call for each file.
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    files += self._find_files(entry.path)
+                else:
+                    if self.product.filename_regexp.match(entry.name):
+                        files.append(Path(entry.path))
         return files
 
     def find_file_covering(self, time):
@@ -76,6 +78,10 @@ class Catalog:
         Return:
             An ``xarray.Dataset`` containing the loaded data.
         """
+        # Imported here since xarray is only needed to load data and slow to
+        # import.
+        import xarray as xr
+
         start_time = to_datetime64(start_time)
         end_time = to_datetime64(end_time)
         indices = np.where((self.times >= start_time) * (self.times <= end_time))[0]
@@ -12,11 +12,13 @@ subsequently added by the user. The Fernet method is used to en- and decrypt
 the passwords. All password hashing is performed using random salt.
 """
 import base64
+from functools import lru_cache
 import getpass
 import json
 import logging
 import os
 from pathlib import Path
+import threading
 
 from appdirs import user_config_dir
 from cryptography.fernet import Fernet
@@ -39,6 +41,10 @@ else:
 
 _PANSAT_SECRET = None
 
+# Serializes authentication when identities are requested from several
+# threads.
+_AUTH_LOCK = threading.Lock()
+
 LOGGER = logging.getLogger(__name__)
 
 ###############################################################################
@@ -150,24 +156,25 @@ def authenticate():
     """
     global _PANSAT_SECRET
 
-    if _PANSAT_SECRET:
-        return
+    with _AUTH_LOCK:
+        if _PANSAT_SECRET:
+            return
 
-    secret_hashed, salt = get_identities()["pansat"]
-    secret_hashed = secret_hashed.encode()
-    salt = salt.encode()
+        secret_hashed, salt = get_identities()["pansat"]
+        secret_hashed = secret_hashed.encode()
+        salt = salt.encode()
 
-    password = get_password()
+        password = get_password()
 
-    entered_secret = hash_password(password, salt)
-    entered_secret_hashed = hash_password(entered_secret.decode(), salt)
+        entered_secret = hash_password(password, salt)
+        entered_secret_hashed = hash_password(entered_secret.decode(), salt)
 
-    if secret_hashed != entered_secret_hashed:
-        LOGGER.error("Wrong password")
-        raise WrongPasswordError("The password you entered is incorrect.")
-    LOGGER.info("Authentification successful.")
+        if secret_hashed != entered_secret_hashed:
+            LOGGER.error("Wrong password")
+            raise WrongPasswordError("The password you entered is incorrect.")
+        LOGGER.info("Authentification successful.")
 
-    _PANSAT_SECRET = entered_secret
+        _PANSAT_SECRET = entered_secret
 
 
 def initialize_identity_file():
@@ -193,6 +200,7 @@ def initialize_identity_file():
 
     secret_hashed = hash_password(_PANSAT_SECRET.decode(), salt)
     _IDENTITIES = {"pansat": (secret_hashed.decode(), salt.decode())}
+    get_identity.cache_clear()
 
     with open(_IDENTITY_FILE, "w") as file:
         file.write(json.dumps(_IDENTITIES))
@@ -207,6 +215,7 @@ def parse_identity_file():
         global _IDENTITIES
         with open(_IDENTITY_FILE) as file:
             _IDENTITIES = json.loads(file.read())
+        get_identity.cache_clear()
 
         LOGGER.info("Parsed identity file: %s", _IDENTITY_FILE)
 
@@ -257,6 +266,7 @@ def add_identity(provider, user_name):
 
     identities = get_identities()
     identities[provider] = (user_name_encrypted.decode(), password_encrypted.decode())
+    get_identity.cache_clear()
     with open(_IDENTITY_FILE, "w") as file:
         file.write(json.dumps(identities))
 
@@ -275,16 +285,22 @@ def delete_identity(provider):
         authenticate()
     identities = get_identities()
     del identities[provider]
+    get_identity.cache_clear()
     with open(_IDENTITY_FILE, "w") as file:
         file.write(json.dumps(identities))
 
     LOGGER.info("Removed identity for provider %s", provider)
 
 
+@lru_cache(maxsize=64)
 def get_identity(provider):
     """
     Retrieve identity for given provider.
 
+    Decrypted identities are cached, so that they are decrypted only once
+    per provider. The cache is cleared whenever the identities are modified
+    or re-read.
+
     Args:
         provider(``str``): Name of provider.
 
@@ -29,10 +29,18 @@ as the password.
    purposes as you cannot expect them to be save when added to
    pansat.
 """
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from io import StringIO
+import os
 import paramiko
 from pathlib import Path
+import queue
+import shutil
+import threading
+import time
+import weakref
 
 from pansat.download.accounts import get_identity
 from pansat.download.providers.discrete_provider import DiscreteProvider
@@ -45,11 +53,43 @@ PRODUCTS = {
     "CloudSat_2C-RAIN PROFILE": "2C-RAIN-PROFILE.P1_R05",
 }
 
+HOST = "www.cloudsat.cira.colostate.edu"
+
+# Maximum number of idle connections kept open per host and provider.
+POOL_SIZE = int(os.environ.get("PANSAT_SFTP_POOL_SIZE", 8))
+
+# Time in seconds after which idle connections are closed.
+MAX_IDLE_TIME = 60
+
+# SSH window and maximum packet size. Larger than paramiko's defaults so that
+# transfers are not limited by round trips.
+WINDOW_SIZE = 1 << 27
+MAX_PACKET_SIZE = 1 << 19
+
+# Block size used when writing downloaded files.
+BLOCK_SIZE = 1 << 20
+
+# Maximum number of SFTP channels opened concurrently over a single
+# connection. Kept below the default 'MaxSessions' limit of OpenSSH servers.
+MAX_CHANNELS = 8
+
+# Minimum time in seconds between two checks whether the server still
+# responds.
+KEEPALIVE_INTERVAL = 10
+
 ######################################################################
 # SFTP Connection
 ######################################################################
 
 
+def _close_connection(transport, sftp):
+    """
+    Close SFTP client and SSH transport of a connection.
+    """
+    sftp.close()
+    transport.close()
+
+
 class SFTPConnection:
     """
     Helper class that manages the lifetime of a paramiko SFTP connection.
@@ -65,9 +105,12 @@ class SFTPConnection:
 
         self.transport = None
         self.sftp = None
+        self._finalizer = None
+        self._last_check = 0.0
         self._connect()
 
     def _connect(self):
+        self.close()
         user_name, key = get_identity(self.provider)
 
         if not Path(key).exists():
@@ -80,9 +123,19 @@ class SFTPConnection:
                 key_buffer = StringIO(key_file.read())
         key_buffer.seek(0)
         key = paramiko.RSAKey.from_private_key(key_buffer)
-        self.transport = paramiko.Transport(self.host)
+        self.transport = paramiko.Transport(
+            self.host,
+            default_window_size=WINDOW_SIZE,
+            default_max_packet_size=MAX_PACKET_SIZE,
+        )
         self.transport.connect(username=user_name, pkey=key)
         self.sftp = paramiko.SFTPClient.from_transport(self.transport)
+        # Close the connection when the object is garbage collected or at
+        # the latest at interpreter exit.
+        self._finalizer = weakref.finalize(
+            self, _close_connection, self.transport, self.sftp
+        )
+        self._last_check = time.monotonic()
 
     def list_files(self, path):
         """
@@ -96,6 +149,33 @@ class SFTPConnection:
         """
         return self.sftp.listdir(path)
 
+    def list_files_many(self, paths, workers=MAX_CHANNELS):
+        """
+        List files in multiple remote directories concurrently.
+
+        Args:
+            paths: The paths of the directories for which to list the files.
+            workers: The maximum number of SFTP channels to use.
+
+        Return:
+            List containing the list of files in each of the given
+            directories. Directories that don't exist yield empty lists.
+        """
+
+        def list_files(sftp, path):
+            try:
+                return sftp.listdir(path)
+            except FileNotFoundError:
+                return []
+
+        return self._map_channels(list_files, [(path,) for path in paths], workers)
+
+    def is_active(self):
+        """
+        Whether the underlying SSH transport is still open.
+        """
+        return self.transport is not None and self.transport.is_active()
+
     def download(self, path, destination):
         """
         Download file to destination.
@@ -105,29 +185,199 @@ class SFTPConnection:
             destination: Path to the file to which to write
                 the results.
         """
-        self.sftp.getfo(path, open(destination, "wb"))
+        self._download(self.sftp, path, destination)
+
+    def download_many(self, pairs, workers=MAX_CHANNELS):
+        """
+        Download multiple files concurrently.
+
+        Args:
+            pairs: Iterable of ``(path, destination)`` tuples containing the
+                remote path of each file to download and the path of the
+                file to which to write it.
+            workers: The maximum number of SFTP channels to use.
+        """
+        self._map_channels(self._download, pairs, workers)
+
+    @staticmethod
+    def _download(sftp, path, destination):
+        """
+        Download file to destination using a given SFTP client.
+
+        All read requests for the file are issued up front, so that the
+        transfer isn't limited by the round-trip time to the server.
+        """
+        with sftp.open(path, "rb") as remote, open(destination, "wb") as output:
+            remote.prefetch()
+            shutil.copyfileobj(remote, output, BLOCK_SIZE)
+            output.flush()
+            # Write the file back and release its pages from the page cache,
+            # so that bulk downloads don't evict other data. Dirty pages
+            # aren't dropped, so the data must be on disk before the advice.
+            if hasattr(os, "posix_fadvise"):
+                os.fdatasync(output.fileno())
+                os.posix_fadvise(output.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    def _map_channels(self, function, args, workers):
+        """
+        Map function over arguments using multiple SFTP channels.
+
+        The channels are opened over the connection's SSH transport, so that
+        authentication is performed only once.
+
+        Args:
+            function: Function taking an ``paramiko.SFTPClient`` as first
+                argument followed by the elements of each tuple in ``args``.
+            args: Iterable of argument tuples.
+            workers: The maximum number of channels to use.
+
+        Return:
+            List containing the results in the order of the arguments.
+        """
+        args = list(args)
+        workers = min(workers, MAX_CHANNELS, len(args))
+        if workers <= 1:
+            return [function(self.sftp, *arg) for arg in args]
+
+        clients = queue.Queue()
+        clients.put(self.sftp)
+        try:
+            for _ in range(workers - 1):
+                clients.put(paramiko.SFTPClient.from_transport(self.transport))
+
+            def call(arg):
+                sftp = clients.get()
+                try:
+                    return function(sftp, *arg)
+                finally:
+                    clients.put(sftp)
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(call, args))
+        finally:
+            while not clients.empty():
+                sftp = clients.get_nowait()
+                if sftp is not self.sftp:
+                    sftp.close()
 
     def ensure_connection(self):
         """
         Ensure that SSH connection is still alive.
+
+        The connection is re-established if the transport has been closed.
+        Whether the server still responds is checked at most every
+        ``KEEPALIVE_INTERVAL`` seconds.
         """
-        try:
-            self.transport.send_ignore()
-        except EOFError:
-            self._connect()
+        if self.is_active():
+            now = time.monotonic()
+            if now - self._last_check < KEEPALIVE_INTERVAL:
+                return
+            try:
+                self.transport.send_ignore()
+                self._last_check = now
+                return
+            except EOFError:
+                pass
+        self._connect()
 
-    def __del__(self):
+    def close(self):
         """Close connection."""
-        if self.sftp is not None:
-            self.sftp.close()
-            self.sftp = None
-        if self.transport is not None:
-            self.transport.close()
-            self.transport = None
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self.sftp = None
+        self.transport = None
 
 
 ######################################################################
-# SFTP Connection
+# Connection pool
+######################################################################
+
+# Idle connections by host and provider as LIFO queues of
+# (connection, last_used) tuples.
+_POOLS = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool(host, provider):
+    """
+    Get pool of idle connections for given host and provider.
+    """
+    with _POOL_LOCK:
+        pool = _POOLS.get((host, provider))
+        if pool is None:
+            pool = queue.LifoQueue(maxsize=POOL_SIZE)
+            _POOLS[(host, provider)] = pool
+        return pool
+
+
+def get_connection(host, provider):
+    """
+    Get an SFTP connection to a given host.
+
+    Reuses the most recently used idle connection from the pool if
+    available. Connections that have been idle for longer than
+    ``MAX_IDLE_TIME`` or that were closed by the server are discarded.
+
+    Args:
+        host: The host to connect to.
+        provider: The name of the provider whose identity to use to
+            log in.
+
+    Return:
+        An ``SFTPConnection`` object connected to the host.
+    """
+    pool = _get_pool(host, provider)
+    while True:
+        try:
+            connection, last_used = pool.get_nowait()
+        except queue.Empty:
+            return SFTPConnection(host, provider)
+        if time.monotonic() - last_used < MAX_IDLE_TIME and connection.is_active():
+            return connection
+        connection.close()
+
+
+def release_connection(connection):
+    """
+    Return a connection to the pool.
+
+    The connection is closed if the pool for its host is full.
+
+    Args:
+        connection: The ``SFTPConnection`` that is no longer used.
+    """
+    if not connection.is_active():
+        connection.close()
+        return
+    pool = _get_pool(connection.host, connection.provider)
+    try:
+        pool.put_nowait((connection, time.monotonic()))
+    except queue.Full:
+        connection.close()
+
+
+@contextmanager
+def sftp_connection(host, provider):
+    """
+    Context manager providing a pooled SFTP connection.
+
+    Args:
+        host: The host to connect to.
+        provider: The name of the provider whose identity to use to
+            log in.
+    """
+    connection = get_connection(host, provider)
+    try:
+        yield connection
+    except BaseException:
+        connection.close()
+        raise
+    release_connection(connection)
+
+
+######################################################################
+# CloudSat DPC provider
 ######################################################################
 
 
@@ -143,25 +393,26 @@ class CloudSatDPCProvider(DiscreteProvider):
         """
         super().__init__(product)
         self.product = product
-        self._connection = None
-
-    @property
-    def connection(self):
-        """SFTP connection object to the data server."""
-        if self._connection is None:
-            self._connection = SFTPConnection(
-                "www.cloudsat.cira.colostate.edu", "CloudSatDPC"
-            )
-        return self._connection
-
-    @connection.setter
-    def connection(self, con):
-        self._connection = con
 
     @staticmethod
     def get_available_products():
         return list(PRODUCTS.keys())
 
+    def _get_directory(self, year, day):
+        """
+        Remote directory containing the files of a given day.
+        """
+        return f"/Data/{PRODUCTS[self.product.name]}/{year:04}/{day:03}"
+
+    def _get_path(self, filename):
+        """
+        Remote path of a given file.
+        """
+        date = self.product.filename_to_date(filename)
+        year = date.year
+        day = (date - datetime(date.year, 1, 1)).days + 1
+        return f"{self._get_directory(year, day)}/{filename}"
+
     def get_files_by_day(self, year, day):
         """
         Get the available for a given day of a year.
@@ -173,15 +424,31 @@ class CloudSatDPCProvider(DiscreteProvider):
         Return:
             List of files available for the given day.
         """
-        self.connection = SFTPConnection(
-            "www.cloudsat.cira.colostate.edu", "CloudSatDPC"
-        )
-        try:
-            directory = f"/Data/{PRODUCTS[self.product.name]}/{year:04}/{day:03}"
-            self.connection.ensure_connection()
-            return self.connection.list_files(directory)
-        except FileNotFoundError as e:
-            return []
+        directory = self._get_directory(year, day)
+        with sftp_connection(HOST, "CloudSatDPC") as connection:
+            try:
+                connection.ensure_connection()
+                return connection.list_files(directory)
+            except FileNotFoundError:
+                return []
+
+    def get_files_by_days(self, days):
+        """
+        Get the available files for multiple days using concurrent SFTP
+        channels.
+
+        Args:
+            days: Iterable of ``(year, day)`` tuples identifying the days
+                for which to look up the files.
+
+        Return:
+            A list containing the list of available files for each of the
+            given days.
+        """
+        directories = [self._get_directory(year, day) for year, day in days]
+        with sftp_connection(HOST, "CloudSatDPC") as connection:
+            connection.ensure_connection()
+            return connection.list_files_many(directories)
 
     def download_file(self, filename, destination):
         """
@@ -191,10 +458,20 @@ class CloudSatDPCProvider(DiscreteProvider):
             filename: The filename of the file to download.
             destination: The destination to which to write the downloaded file.
         """
-        date = self.product.filename_to_date(filename)
+        path = self._get_path(filename)
+        with sftp_connection(HOST, "CloudSatDPC") as connection:
+            connection.ensure_connection()
+            connection.download(path, destination)
 
-        year = date.year
-        day = (date - datetime(date.year, 1, 1)).days + 1
-        path = f"/Data/{PRODUCTS[self.product.name]}/" f"{year:04}/{day:03}/{filename}"
-        self.connection.ensure_connection()
-        self.connection.download(path, destination)
+    def download_files(self, filenames, destinations):
+        """
+        Download multiple files using concurrent SFTP channels.
+
+        Args:
+            filenames: The names of the files to download.
+            destinations: The paths to which to write the downloaded files.
+        """
+        paths = [self._get_path(filename) for filename in filenames]
+        with sftp_connection(HOST, "CloudSatDPC") as connection:
+            connection.ensure_connection()
+            connection.download_many(zip(paths, destinations))
@@ -7,11 +7,11 @@ providers where available cannot be determined a priori but need to be looked
 up on a per-day basis.
 """
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from pansat.download.providers.data_provider import DataProvider
 from pansat.time import to_datetime
-import numpy as np
 
 
 class DiscreteProvider(DataProvider):
@@ -21,8 +21,17 @@ class DiscreteProvider(DataProvider):
     ``get_files_by_day`` and the ``download_file`` function to be implemented
     and the extends the functionality to match the general DataProvider
     interface.
+
+    Attributes:
+        max_workers(``int``): The maximum number of requests that the
+            provider issues concurrently. Providers whose
+            ``get_files_by_day`` and ``download_file`` methods are safe to
+            call from multiple threads may set this to a value larger than
+            one.
     """
 
+    max_workers = 1
+
     def __init__(self, product):
         super().__init__()
         self.product = product
@@ -67,22 +76,83 @@ class DiscreteProvider(DataProvider):
         end_time = to_datetime(end_time)
 
         if not destination:
-            destination = self.product.default_destination
+            destination = self._get_default_destination()
         else:
             destination = Path(destination)
-        destination.mkdir(parents=True, exist_ok=True)
+            destination.mkdir(parents=True, exist_ok=True)
 
         files = self.get_files_in_range(start_time, end_time)
         if len(files) == 0:
             files = self.get_files_in_range(start_time, end_time, True)
 
-        downloaded = []
-        for f in files:
-            path = destination / f
-            self.download_file(f, path)
-            downloaded.append(path)
+        downloaded = [destination / f for f in files]
+        self.download_files(files, downloaded)
         return downloaded
 
+    def download_files(self, filenames, destinations):
+        """
+        Download multiple files from data provider.
+
+        By default, files are downloaded using ``download_file`` with up to
+        ``max_workers`` threads. Providers that can transfer multiple files
+        more efficiently may override this method.
+
+        Args:
+            filenames(``list``): The names of the files to download.
+            destinations(``list``): The paths to which to write the
+                downloaded files.
+        """
+        self._map(
+            lambda args: self.download_file(*args), zip(filenames, destinations)
+        )
+
+    def _map(self, function, iterable):
+        """
+        Map function over iterable using up to ``max_workers`` threads.
+
+        Args:
+            function: The function to apply.
+            iterable: The arguments to apply the function to.
+
+        Return:
+            A list containing the results in the order of the inputs.
+        """
+        iterable = list(iterable)
+        n_workers = min(self.max_workers, len(iterable))
+        if n_workers <= 1:
+            return list(map(function, iterable))
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            return list(pool.map(function, iterable))
+
+    def get_files_by_days(self, days):
+        """
+        Return lists of available files for multiple days.
+
+        Args:
+            days: Iterable of ``(year, day)`` tuples identifying the days
+                for which to look up the files.
+
+        Return:
+            A list containing the list of available files for each of the
+            given days.
+        """
+        return self._map(lambda year_day: self.get_files_by_day(*year_day), days)
+
+    def _get_default_destination(self):
+        """
+        Return the default destination of the product and make sure it
+        exists.
+
+        The destination is resolved and created only once for each provider
+        instance.
+        """
+        destination = self.__dict__.get("_default_destination")
+        if destination is None:
+            destination = Path(self.product.default_destination)
+            destination.mkdir(parents=True, exist_ok=True)
+            self._default_destination = destination
+        return destination
+
     def get_files_in_range(self, start_time, end_time, start_inclusive=True):
         """
         Get all files within time range.
@@ -104,27 +174,37 @@ class DiscreteProvider(DataProvider):
 
         """
         delta = timedelta(days=1)
+        filename_to_date = self.product.filename_to_date
+
+        def sort_by_date(files):
+            """
+            Sort files by date and return the sorted files together with
+            their dates, so that each filename is parsed only once.
+            """
+            dates = [filename_to_date(f) for f in files]
+            order = sorted(range(len(files)), key=dates.__getitem__)
+            return [files[i] for i in order], [dates[i] for i in order]
+
+        # Look up all days within the range at once.
+        days = [(start_time.year, int(start_time.strftime("%j")))]
+        time = start_time + delta
+        while (time - end_time).total_seconds() < 24 * 60 * 60:
+            days.append((time.year, int(time.strftime("%j"))))
+            time += delta
+        files_by_day = dict(zip(days, self.get_files_by_days(days)))
 
         year = start_time.year
         day = int(start_time.strftime("%j"))
-        files_of_day = self.get_files_by_day(year, day)
-        files_of_day = sorted(files_of_day, key=self.product.filename_to_date)
-        time_deltas_start = np.array(
-            [
-                (self.product.filename_to_date(f) - start_time).total_seconds()
-                for f in files_of_day
-            ]
-        )
+        files_of_day, dates_of_day = sort_by_date(files_by_day[(year, day)])
         if (
-            len(time_deltas_start) == 0 or time_deltas_start.min() > 0
+            len(dates_of_day) == 0 or min(dates_of_day) > start_time
         ) and start_inclusive:
             previous_day = start_time - timedelta(days=1)
             year = previous_day.year
             day = int(previous_day.strftime("%j"))
-            files = self.get_files_by_day(year, day)
-            files_of_day = (
-                sorted(files, key=self.product.filename_to_date) + files_of_day
-            )
+            files, dates = sort_by_date(self.get_files_by_day(year, day))
+            files_of_day = files + files_of_day
+            dates_of_day = dates + dates_of_day
 
         #
         # Go over days within range an add all included files.
@@ -137,33 +217,14 @@ class DiscreteProvider(DataProvider):
             if time != start_time:
                 year = time.year
                 day = int(time.strftime("%j"))
-                files_of_day = self.get_files_by_day(year, day)
-                files_of_day = sorted(files_of_day, key=self.product.filename_to_date)
-
-            time_deltas_start = np.array(
-                [
-                    (self.product.filename_to_date(f) - start_time).total_seconds()
-                    for f in files_of_day
-                ]
-            )
+                files_of_day, dates_of_day = sort_by_date(files_by_day[(year, day)])
 
-            indices = np.where(time_deltas_start >= 0.0)[0]
-            if len(indices) > 0:
-                start_index = indices[0]
-            else:
-                start_index = -1
-
-            time_deltas_end = np.array(
-                [
-                    (self.product.filename_to_date(f) - end_time).total_seconds()
-                    for f in files_of_day
-                ]
+            start_index = next(
+                (i for i, date in enumerate(dates_of_day) if date >= start_time), -1
+            )
+            end_index = next(
+                (i for i, date in enumerate(dates_of_day) if date > end_time), None
             )
-            indices = np.where(time_deltas_end > 0.0)[0]
-            if len(indices) > 0:
-                end_index = indices[0]
-            else:
-                end_index = None
 
             if start_index > 0 and start_inclusive:
                 start_index -= 1
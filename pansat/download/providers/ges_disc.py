@@ -14,10 +14,13 @@ import logging
 import os
 import pathlib
 import re
-import tempfile
+import shutil
+import uuid
 import xml.etree.ElementTree as ET
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pansat.download import accounts
 from pansat.download.providers.discrete_provider import DiscreteProvider
@@ -29,6 +32,109 @@ with open(_DATA_FOLDER / "gpm_products.json", "r") as file:
 
 LOGGER = logging.getLogger(__file__)
 
+# Headers sent with every request to the GES DISC servers.
+HEADERS = {"User-Agent": "pansat", "Accept": "*/*"}
+
+# Connect and read timeouts for requests to the GES DISC servers.
+TIMEOUT = (10, 60)
+
+# Buffer size used to copy downloaded data to disk.
+BUFFER_SIZE = 1 << 20
+
+# Retry policy for transient server and connection errors.
+RETRY = Retry(
+    total=8,
+    connect=5,
+    read=5,
+    status=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    respect_retry_after_header=True,
+)
+
+
+def _create_session(auth):
+    """
+    Create a session for requests to the GES DISC servers.
+
+    The session retries requests that fail due to transient errors with
+    exponential backoff.
+
+    Args:
+        auth: The credentials to use for the session.
+
+    Return:
+        A ``requests.Session`` object.
+    """
+    session = requests.Session()
+    session.auth = auth
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(max_retries=RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _is_up_to_date(response, destination):
+    """
+    Determine whether a local file matches the body of a response.
+
+    The check compares the size of the local file with the 'Content-Length'
+    header of the response. It is only performed for responses that
+    aren't content-encoded.
+
+    Args:
+        response: A ``requests.Response`` object created with
+            ``stream=True``.
+        destination: The path of the local file.
+
+    Return:
+        ``True`` if the local file exists and has the size of the response
+        body. ``False`` otherwise.
+    """
+    destination = pathlib.Path(destination)
+    if not destination.exists():
+        return False
+    if response.headers.get("Content-Encoding"):
+        return False
+    length = response.headers.get("Content-Length")
+    if length is None:
+        return False
+    return int(length) == destination.stat().st_size
+
+
+def _write_response(response, destination):
+    """
+    Write the body of a streamed response to a file.
+
+    The data is first written to a temporary file in the destination
+    folder, which is then moved to the destination. This ensures that the
+    destination file is either complete or not present at all.
+
+    Args:
+        response: A ``requests.Response`` object created with
+            ``stream=True``.
+        destination: The path of the file to which to write the data.
+    """
+    destination = pathlib.Path(destination)
+    if response.headers.get("Content-Encoding"):
+        response.raw.decode_content = True
+    # The temporary file is created with the default permissions for new
+    # files, i.e. 0o666 restricted by the umask, because os.replace keeps
+    # them. Files created by the tempfile module are only readable by the
+    # owner.
+    tmp_path = destination.parent / f".pansat_{destination.name}.{uuid.uuid4().hex}"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    with open(os.open(tmp_path, flags, 0o666), "wb") as tmp:
+        try:
+            shutil.copyfileobj(response.raw, tmp, BUFFER_SIZE)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp_path)
+            raise
+    os.replace(tmp_path, destination)
+
 
 class GesdiscProvider(DiscreteProvider):
     """
@@ -37,7 +143,7 @@ class GesdiscProvider(DiscreteProvider):
     """
 
     base_url = "https://gpm1.gesdisc.eosdis.nasa.gov"
-    file_pattern = re.compile('"[^"]*\.(?:HDF5|h5|nc|nc4)"')
+    file_pattern = re.compile(rb'"[^"]*\.(?:HDF5|h5|nc|nc4)"')
 
     def __init__(self, product):
         """
@@ -68,18 +174,17 @@ class GesdiscProvider(DiscreteProvider):
         # urs.earthdata.nasa.gov, but `auth` is not used as the authorization
         # is after a redirection
         # The method below handles the authorization after a redirection
-        with requests.Session() as session:
-            # Set credentials
-            session.auth = auth
-
+        with _create_session(auth) as session:
             # Get data
-            redirect = session.get(url)
-            response = session.get(redirect.url)
+            redirect = session.get(url, timeout=TIMEOUT)
+            response = session.get(redirect.url, stream=True, timeout=TIMEOUT)
 
             # Write to disk
-            with open(destination, "wb") as f:
-                for chunk in response:
-                    f.write(chunk)
+            if _is_up_to_date(response, destination):
+                LOGGER.info("Skipping download of existing file %s.", destination)
+                response.close()
+                return
+            _write_response(response, destination)
 
     @property
     def _request_string(self):
@@ -101,8 +206,8 @@ class GesdiscProvider(DiscreteProvider):
         request_string = self._request_string.format(year=year, day="", filename="")
         auth = accounts.get_identity("GES DISC")
         response = requests.get(request_string, auth=auth)
-        files = list(set(GesdiscProvider.file_pattern.findall(response.text)))
-        return [f[1:-1] for f in files]
+        files = list(set(GesdiscProvider.file_pattern.findall(response.content)))
+        return [f[1:-1].decode() for f in files]
 
     def get_files_by_month(self, year, month):
         """
@@ -120,8 +225,8 @@ class GesdiscProvider(DiscreteProvider):
         )
         auth = accounts.get_identity("GES DISC")
         response = requests.get(request_string, auth=auth)
-        files = list(set(GesdiscProvider.file_pattern.findall(response.text)))
-        return [f[1:-1] for f in files]
+        files = list(set(GesdiscProvider.file_pattern.findall(response.content)))
+        return [f[1:-1].decode() for f in files]
 
     def get_files_by_day(self, year, day):
         """
@@ -143,15 +248,15 @@ class GesdiscProvider(DiscreteProvider):
         request_string = self._request_string.format(year=year, day=day, filename="")
         auth = accounts.get_identity("GES DISC")
         response = requests.get(request_string, auth=auth)
-        files = list(set(GesdiscProvider.file_pattern.findall(response.text)))
+        files = list(set(GesdiscProvider.file_pattern.findall(response.content)))
         if len(files) == 0:
             month = f"{month:02}"
             request_string = self._request_string.format(
                 year=year, day=month, filename=""
             )
             response = requests.get(request_string, auth=auth)
-            files = list(set(GesdiscProvider.file_pattern.findall(response.text)))
-        return [f[1:-1] for f in files]
+            files = list(set(GesdiscProvider.file_pattern.findall(response.content)))
+        return [f[1:-1].decode() for f in files]
 
     def _download_with_redirect(self, url, destination):
         """
@@ -163,13 +268,15 @@ class GesdiscProvider(DiscreteProvider):
         """
         auth = accounts.get_identity("GES DISC")
 
-        with requests.Session() as session:
-            response = session.get(url)
-            response = session.get(response.url, auth=auth, stream=True)
+        with _create_session(auth) as session:
+            response = session.get(url, timeout=TIMEOUT)
+            response = session.get(response.url, stream=True, timeout=TIMEOUT)
             response.raise_for_status()
-            with open(destination, "wb") as f:
-                for chunk in response:
-                    f.write(chunk)
+            if _is_up_to_date(response, destination):
+                LOGGER.info("Skipping download of existing file %s.", destination)
+                response.close()
+                return
+            _write_response(response, destination)
 
     def download_file(self, filename, destination):
         """
@@ -225,7 +332,7 @@ class Disc2Provider(GesdiscProvider):
     }
 
     base_url = "https://disc2.gesdisc.eosdis.nasa.gov"
-    file_pattern = re.compile('"[^"]*.nc4"')
+    file_pattern = re.compile(rb'"[^"]*.nc4"')
 
     def __init__(self, product):
         """
@@ -251,10 +358,10 @@ class Disc2Provider(GesdiscProvider):
     @classmethod
     def download_url(cls, url, destination):
         auth = accounts.get_identity("GES DISC")
-        r = requests.get(url, auth=auth)
-        with open(destination, "wb") as f:
-            for chunk in r:
-                f.write(chunk)
+        with requests.get(url, auth=auth, stream=True) as r:
+            with open(destination, "wb") as f:
+                for chunk in r.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
 
     @property
     def _request_string(self):
@@ -120,7 +120,7 @@ class GOESAWSProvider(DiscreteProvider):
         day = t.strftime("%j")
         hour = t.hour
         request_string = self._get_request_url(year, day, hour, filename)
-        r = requests.get(request_string)
-        with open(destination, "wb") as f:
-            for chunk in r:
-                f.write(chunk)
+        with requests.get(request_string, stream=True) as r:
+            with open(destination, "wb") as f:
+                for chunk in r.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
@@ -116,7 +116,7 @@ class HimawariAWSProvider(DiscreteProvider):
         hour = t.hour
         minute = t.minute
         request_string = self._get_request_url(year, month, day, hour, minute, filename)
-        r = requests.get(request_string)
-        with open(destination, "wb") as f:
-            for chunk in r:
-                f.write(chunk)
+        with requests.get(request_string, stream=True) as r:
+            with open(destination, "wb") as f:
+                for chunk in r.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
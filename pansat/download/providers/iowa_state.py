@@ -10,6 +10,7 @@ Department of Geological and atmospheric sciences at Iowa State University.
 This provider doesn't require any user authentication to download data.
 """
 from datetime import datetime, timedelta
+import re
 import shutil
 
 import requests
@@ -23,6 +24,9 @@ PRODUCTS = {
     "MRMS_SeamlessHSR": ["mrms", "ncep", "SeamlessHSR"],
 }
 
+# Extracts link targets from the raw HTML of a directory listing.
+HREF_REGEXP = re.compile(rb'href="([^"]+)"')
+
 
 class IowaStateProvider(DiscreteProvider):
     """
@@ -30,6 +34,7 @@ class IowaStateProvider(DiscreteProvider):
     """
 
     base_url = "https://mtarchive.geol.iastate.edu/"
+    max_workers = 4
 
     def __init__(self, product):
         """
@@ -74,8 +79,16 @@ class IowaStateProvider(DiscreteProvider):
         date = datetime(year=year, month=1, day=1) + timedelta(days=day - 1)
         url = self.get_url(date)
         with requests.get(url) as r:
-            files_unique = set(self.product.filename_regexp.findall(r.text))
-            return sorted(list(files_unique))
+            links = HREF_REGEXP.findall(r.content)
+        # Only the link targets are matched against the product regexp,
+        # which avoids scanning the full HTML with the more complex pattern.
+        filename_regexp = self.product.filename_regexp
+        files_unique = set()
+        for link in links:
+            match = filename_regexp.search(link.decode())
+            if match is not None:
+                files_unique.add(match.group(0))
+        return sorted(list(files_unique))
 
     def download_file(self, filename, destination):
         """
@@ -31,7 +31,8 @@ class LAADSDAACProvider(DiscreteProvider):
     """
 
     base_url = "https://ladsweb.modaps.eosdis.nasa.gov/archive/allData/61/"
-    file_pattern = re.compile("[\w\.]*.hdf")
+    file_pattern = re.compile(rb"[\w\.]*.hdf")
+    max_workers = 4
 
     def __init__(self, product):
         """
@@ -76,8 +77,8 @@ class LAADSDAACProvider(DiscreteProvider):
         day = "0" * (3 - len(day)) + day
         request_string = self._request_string.format(year=year, day=day, filename="")
         response = requests.get(request_string)
-        files = list(set(LAADSDAACProvider.file_pattern.findall(response.text)))
-        return [f for f in files]
+        files = set(LAADSDAACProvider.file_pattern.findall(response.content))
+        return [f.decode() for f in files]
 
     def download_file(self, filename, destination):
         """
@@ -97,10 +98,12 @@ class LAADSDAACProvider(DiscreteProvider):
         )
 
         auth = accounts.get_identity("GES DISC")
-        response = requests.get(request_string, auth=auth)
-        url = response.url
-        response = requests.get(url, auth=auth)
-
-        with open(destination, "wb") as f:
-            for chunk in response:
-                f.write(chunk)
+        # Only the URL after redirection is needed, so the body of the first
+        # response isn't read.
+        with requests.get(request_string, auth=auth, stream=True) as response:
+            url = response.url
+
+        with requests.get(url, auth=auth, stream=True) as response:
+            with open(destination, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
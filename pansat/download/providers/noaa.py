@@ -4,15 +4,26 @@ pansat.download.providers.noaa
 
 This module provides the NoaaProvider class to download data stored at the NOAA data server.
 
+By default, files are downloaded from the FTP server of the NOAA Physical
+Science Laboratory. Passing an HTTP(S) URL, such as ``HTTPS_URL``, as
+``base_url`` to ``NOAAProvider.download`` downloads the files over HTTPS
+instead.
 """
 
 
+from concurrent.futures import ThreadPoolExecutor
 import ftplib
 from ftplib import FTP
 from pathlib import Path
-import numpy as np
+import queue
+import shutil
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from pansat.download.accounts import get_identity
 from pansat.download.providers.data_provider import DataProvider
+from pansat.download.providers.ges_disc import RETRY, TIMEOUT
 
 
 NOAA_PRODUCTS = [
@@ -24,6 +35,23 @@ NOAA_PRODUCTS = [
     "igra-soundings",
 ]
 
+# Maximum number of concurrent FTP connections used for downloads. Kept small
+# to stay within the per-IP connection limits of the NOAA servers.
+MAX_CONNECTIONS = 4
+
+# Block size used when retrieving files.
+BLOCK_SIZE = 1 << 20
+
+# URL of the HTTPS server providing the same data as the FTP server.
+HTTPS_URL = "https://downloads.psl.noaa.gov"
+
+# Session shared by all HTTPS downloads. Requests failing due to transient
+# errors are retried with the same policy as for the GES DISC servers.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(max_retries=RETRY, pool_maxsize=2 * MAX_CONNECTIONS)
+)
+
 
 class NOAAProvider(DataProvider):
     """
@@ -93,12 +121,12 @@ class NOAAProvider(DataProvider):
                     ftp.cwd(path)
                 except:
                     raise Exception(
-                        "Can't find product folder "
-                        + path
-                        + "on the NOAA server. Are you sure this is the right path?"
+                        f"Can't find product folder {path} on the NOAA server."
+                        " Are you sure this is the right path?"
                     )
                 listing = ftp.nlst()
-            listing = [item_type(l) for l in listing]
+            if item_type is not str:
+                listing = [item_type(l) for l in listing]
             self.cache[path] = listing
         return self.cache[path]
 
@@ -115,15 +143,10 @@ class NOAAProvider(DataProvider):
             List of the filenames of this product for given variable and time range by year.
         """
 
-        files = []
-        for year in np.arange(start, end + 1):
-            year_str = str(year)
-            filename = var + "." + year_str + ".nc"
-            files.append(filename)
-        return files
+        return [f"{var}.{year}.nc" for year in range(int(start), int(end) + 1)]
 
     def download(
-        self, start, end, destination, base_url=None, product_path=None, files=None
+        self, start, end, destination=None, base_url=None, product_path=None, files=None
     ):
         """
         This method downloads data for a given time range from the respective
@@ -133,8 +156,10 @@ class NOAAProvider(DataProvider):
             start(``int``): start year
             end(``int``): end year
             destination(``str`` or ``pathlib.Path``): path to directory where
-                the downloaded files should be stored.
-            base_url(``str``): base url
+                the downloaded files should be stored. Defaults to the
+                default destination of the product.
+            base_url(``str``): base url. If it starts with 'http', the files
+                are downloaded over HTTP(S) instead of FTP.
             files(`list``): list of files if files are not sorted by year
         """
 
@@ -143,22 +168,110 @@ class NOAAProvider(DataProvider):
         if product_path is None:
             product_path = self.product_path
 
+        if destination is None:
+            destination = Path(self.product.default_destination)
+        else:
+            destination = Path(destination)
+        destination.mkdir(parents=True, exist_ok=True)
+
         # get file list
         if files is None:
             files = self.get_file_names(self.product.variable, start, end)
+        if not files:
+            return []
 
-        ftp = ftplib.FTP(base_url)
-        user, password = get_identity("NOAAProvider")
-        ftp.login(user=user, passwd=password)
-        ftp.cwd(product_path)
+        n_workers = min(MAX_CONNECTIONS, len(files))
 
-        output_files = []
-        for filename in files:
-            output = Path(str(destination)) / str(filename)
-            output_files.append(str(output))
-            with open(str(output), "wb") as ftpfile:
-                ftp.retrbinary("RETR " + filename, ftpfile.write)
+        if base_url.startswith("http"):
 
-        ftp.quit()
+            def download_file(filename):
+                return self._download_file_http(
+                    base_url, product_path, filename, destination
+                )
 
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                return list(pool.map(download_file, files))
+
+        # Each worker logs in once and downloads files from a shared queue
+        # over its own FTP connection. The identity is resolved up front to
+        # avoid concurrent password prompts.
+        identity = get_identity("NOAAProvider")
+        pending = queue.Queue()
+        for index, filename in enumerate(files):
+            pending.put((index, filename))
+
+        def download_files(_):
+            return self._download_files(
+                base_url, product_path, pending, destination, identity
+            )
+
+        output_files = [None] * len(files)
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            for downloaded in pool.map(download_files, range(n_workers)):
+                for index, output in downloaded:
+                    output_files[index] = output
         return output_files
+
+    @staticmethod
+    def _download_file_http(base_url, product_path, filename, destination):
+        """
+        Download a single file over HTTP(S).
+
+        Args:
+            base_url(``str``): HTTP(S) URL without subdirectories.
+            product_path(``str``): The path of the product folder on the
+                server.
+            filename(``str``): The name of the file to download.
+            destination(``pathlib.Path``): path to directory where the
+                downloaded file should be stored.
+
+        Return:
+            The path of the downloaded file as ``str``.
+        """
+        output = str(destination / filename)
+        url = "/".join([base_url.rstrip("/"), product_path.strip("/"), filename])
+        with _SESSION.get(url, stream=True, timeout=TIMEOUT) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(output, "wb") as output_file:
+                shutil.copyfileobj(response.raw, output_file, BLOCK_SIZE)
+        return output
+
+    @staticmethod
+    def _download_files(base_url, product_path, files, destination, identity):
+        """
+        Download files from a queue over a single FTP connection.
+
+        Args:
+            base_url(``str``): FTP URL without subdirectories.
+            product_path(``str``): The path of the product folder on the
+                server.
+            files(``queue.Queue``): Queue of ``(index, filename)`` tuples
+                of the files to download. Files are downloaded until the
+                queue is empty.
+            destination(``pathlib.Path``): path to directory where the
+                downloaded files should be stored.
+            identity(``tuple``): User name and password to use to login to
+                the FTP server.
+
+        Return:
+            List of ``(index, path)`` tuples containing the index and the
+            path of each downloaded file as ``str``.
+        """
+        downloaded = []
+        user, password = identity
+        with ftplib.FTP(base_url) as ftp:
+            ftp.login(user=user, passwd=password)
+            ftp.cwd(product_path)
+            while True:
+                try:
+                    index, filename = files.get_nowait()
+                except queue.Empty:
+                    break
+                output = str(destination / filename)
+                with open(output, "wb") as ftpfile:
+                    ftp.retrbinary(
+                        "RETR " + filename, ftpfile.write, blocksize=BLOCK_SIZE
+                    )
+                downloaded.append((index, output))
+        return downloaded
@@ -6,15 +6,38 @@ This module defines a provider for the NOAA NCEI data server containing
 the GridSat brightness temperature datasets available at
  https://www.ncei.noaa.gov/data/
 """
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import re
+import threading
+import time
 
 import requests
+from requests.adapters import HTTPAdapter
 from pansat.download.providers.discrete_provider import DiscreteProvider
 
 
 BASE_URL = "https://www.ncei.noaa.gov/data"
 
+# Extracts links to NetCDF files from a directory listing.
+LINK_REGEX = re.compile(rb'href="([^"]+?\.nc)"')
+
+# Session shared by all requests to the NCEI server.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+# Time in seconds for which retrieved listings are used without checking
+# whether they have changed.
+LISTING_TTL = 600
+
+# Maximum number of cached listings.
+MAX_LISTINGS = 256
+
+# Cached listings as (retrieval time, ETag, Last-Modified, links) tuples by
+# URL in the order in which they were last used.
+_LISTINGS = OrderedDict()
+_LISTINGS_LOCK = threading.Lock()
+
 
 NCEI_PRODUCTS = {
     "gridsat_goes": "gridsat-goes/access/goes",
@@ -23,12 +46,85 @@ NCEI_PRODUCTS = {
 }
 
 
+def _store_listing(url, listing):
+    """
+    Store listing in the cache and drop the least recently used listings
+    if the cache is full.
+    """
+    with _LISTINGS_LOCK:
+        _LISTINGS[url] = listing
+        _LISTINGS.move_to_end(url)
+        while len(_LISTINGS) > MAX_LISTINGS:
+            _LISTINGS.popitem(last=False)
+
+
+def get_links(url):
+    """
+    Extract links to NetCDF files from a directory listing.
+
+    Listings are cached by URL and reused for ``LISTING_TTL`` seconds.
+    Older listings are revalidated using the ``ETag`` and ``Last-Modified``
+    headers of the previous response, so that unchanged listings aren't
+    transferred again.
+
+    Args:
+        url: The URL of the directory listing.
+
+    Return:
+        Tuple containing the targets of all links to NetCDF files.
+
+    Raises:
+        requests.exceptions.HTTPError: If the listing could not be retrieved.
+    """
+    with _LISTINGS_LOCK:
+        listing = _LISTINGS.get(url)
+        if listing is not None:
+            _LISTINGS.move_to_end(url)
+    headers = {}
+    if listing is not None:
+        retrieved, etag, last_modified, links = listing
+        if time.monotonic() - retrieved < LISTING_TTL:
+            return links
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+
+    response = _SESSION.get(url, headers=headers)
+    if response.status_code == 304 and listing is not None:
+        _store_listing(url, (time.monotonic(), etag, last_modified, links))
+        return links
+    response.raise_for_status()
+
+    # Listings may link to the same file several times.
+    links = dict.fromkeys(LINK_REGEX.findall(response.content))
+    links = tuple(link.split(b"/")[-1].decode() for link in links)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    _store_listing(url, (time.monotonic(), etag, last_modified, links))
+    return links
+
+
+def expire_listings():
+    """
+    Mark all cached directory listings as expired.
+
+    The listings are kept so that the next request for each of them is
+    revalidated with the server instead of being retrieved in full.
+    """
+    with _LISTINGS_LOCK:
+        for url, (_, etag, last_modified, links) in _LISTINGS.items():
+            _LISTINGS[url] = (float("-inf"), etag, last_modified, links)
+
+
 class NOAANCEIProvider(DiscreteProvider):
     """
        Data provider for GridSat GOES datasets  available at
     https://www.ncei.noaa.gov/data/.
     """
 
+    max_workers = 8
+
     def __init__(self, product):
         """
         Instantiate provider for given product.
@@ -38,6 +134,7 @@ class NOAANCEIProvider(DiscreteProvider):
         """
         super().__init__(product)
         self.product = product
+        self.product_url = f"{BASE_URL}/{NCEI_PRODUCTS[product.name]}"
         self.cache = {}
 
     @classmethod
@@ -62,18 +159,41 @@ class NOAANCEIProvider(DiscreteProvider):
         Return:
             A list of the available files.
         """
-        url = f"{BASE_URL}/{NCEI_PRODUCTS[self.product.name]}/{year:04}/{month:02}"
-        response = requests.get(url)
+        url = f"{self.product_url}/{year:04}/{month:02}"
         # Some products aren't split up by month. So try to get files by year
         # instead.
         try:
-            response.raise_for_status()
+            return list(get_links(url))
+        except requests.exceptions.HTTPError:
+            url = f"{self.product_url}/{year:04}/"
+        try:
+            return list(get_links(url))
         except requests.exceptions.HTTPError:
-            url = f"{BASE_URL}/{NCEI_PRODUCTS[self.product.name]}/{year:04}/"
-            response = requests.get(url)
+            return []
 
-        pattern = re.compile(r'<a href="([^"]*\.nc)">')
-        return pattern.findall(response.text)
+    def _get_files_of_month(self, year, month):
+        """
+        Get files available in a given month together with their dates.
+
+        The files of each month are cached, so that filenames are parsed
+        only once per month. Links to files of other products are skipped
+        before their dates are parsed.
+
+        Args:
+            year: The year as ``int``.
+            month: The month of the year as ``int``.
+
+        Return:
+            A list of ``(filename, date)`` tuples.
+        """
+        files = self.cache.get((year, month))
+        if files is None:
+            files = filter(self.product.matches, self.get_files_by_month(year, month))
+            files = list(files)
+            dates = map(self.product.filename_to_date, files)
+            files = list(zip(files, dates))
+            self.cache[(year, month)] = files
+        return files
 
     def get_files_by_day(self, year, day):
         """
@@ -89,19 +209,36 @@ class NOAANCEIProvider(DiscreteProvider):
         date = datetime(year, 1, 1) + timedelta(days=day - 1)
         month = date.month
         day_of_month = date.day
-
-        files = self.cache.get((year, month))
-        if files is None:
-            files = self.get_files_by_month(year, month)
-            self.cache[(year, month)] = files
-
-        dates = map(self.product.filename_to_date, files)
-        files = [
+        files = self._get_files_of_month(year, month)
+        return [
             name
-            for name, date in zip(files, dates)
+            for name, date in files
             if date.day == day_of_month and date.month == month
         ]
-        return files
+
+    def get_files_by_days(self, days):
+        """
+        Return lists of available files for multiple days.
+
+        Listings are organized by month, so the listing of each month is
+        retrieved only once before the files are split up by day. Listings of
+        different months are retrieved concurrently.
+
+        Args:
+            days: Iterable of ``(year, day)`` tuples identifying the days
+                for which to look up the files.
+
+        Return:
+            A list containing the list of available files for each of the
+            given days.
+        """
+        days = list(days)
+        months = {}
+        for year, day in days:
+            date = datetime(year, 1, 1) + timedelta(days=day - 1)
+            months[(year, date.month)] = None
+        self._map(lambda year_month: self._get_files_of_month(*year_month), months)
+        return [self.get_files_by_day(year, day) for year, day in days]
 
     def download_file(self, filename, destination):
         """
@@ -116,16 +253,17 @@ class NOAANCEIProvider(DiscreteProvider):
         year = date.year
         month = date.month
 
-        url = f"{BASE_URL}/{NCEI_PRODUCTS[self.product.name]}/{year:04}/{month:02}/{filename}"
+        url = f"{self.product_url}/{year:04}/{month:02}/{filename}"
 
-        response = requests.get(url)
+        response = _SESSION.get(url, stream=True)
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError:
-            url = f"{BASE_URL}/{NCEI_PRODUCTS[self.product.name]}/{year:04}/{filename}"
-            response = requests.get(url)
+            response.close()
+            url = f"{self.product_url}/{year:04}/{filename}"
+            response = _SESSION.get(url, stream=True)
             response.raise_for_status()
 
-        with open(destination, "wb") as output:
-            for chunk in response:
+        with response, open(destination, "wb") as output:
+            for chunk in response.iter_content(chunk_size=1 << 16):
                 output.write(chunk)
@@ -5,15 +5,30 @@ pansat.download.provider.scapers.open_dap
 This module implements functions to extract available products from NASA
  OpenDAP servers.
 """
+from html import unescape
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse, urljoin
 import re
 
 import requests
-from bs4 import BeautifulSoup
 
 URL = "https://gpm1.gesdisc.eosdis.nasa.gov/opendap/"
 
+# Extracts link targets and link texts from a web page.
+LINK_REGEXP = re.compile(
+    r'<a\b[^>]*?\bhref="([^"]*)"[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL
+)
+
+# Matches HTML tags nested inside link texts.
+TAG_REGEXP = re.compile(r"<[^>]*>")
+
+# Matches link texts whose second-to-last component is a year between 1901 and
+# 2099 or a day of year between 1 and 365.
+DATE_FOLDER_REGEXP = re.compile(
+    r"(?:^|/)0*(?:19(?:0[1-9]|[1-9]\d)|20\d\d|[1-9]\d?|[12]\d\d|3[0-5]\d|36[0-5])"
+    r"/[^/]*$"
+)
+
 
 def retrieve_page(url):
     """
@@ -38,23 +53,50 @@ def is_date(text):
         True is the last components of the link name represent a year or day of
         year.
     """
-    try:
-        last_component = text.split("/")[-2]
-        year = int(last_component)
-        if year > 1900 and year < 2100:
-            return True
-        day = int(last_component)
-        return (day > 0) and (day < 366)
-    except ValueError:
-        return False
+    return DATE_FOLDER_REGEXP.search(text) is not None
+
+
+def get_child_pages(parent_url, text):
+    """
+    Find child pages to scrape on a given web page.
+
+    Only links pointing to HTML pages in sub-folders of the parent URL are
+    considered. Since folders representing dates all contain the same
+    products, only the first of them is returned.
+
+    Args:
+        parent_url: The URL of the web page.
+        text: The content of the web page.
+
+    Return:
+        List of the URLs of the child pages.
+    """
+    children = []
+    parent_url = urlparse(parent_url)
+    parent_path = Path(parent_url.path)
+    for href, link_text in LINK_REGEXP.findall(text):
+        url = urlparse(unescape(href))
+        if not url.netloc:
+            link_text = unescape(TAG_REGEXP.sub("", link_text))
+            child_path = parent_path / url.path
+            is_parent = parent_path in child_path.parents
+            is_html = str(child_path)[-5:].lower() == ".html"
+            is_folder = link_text.endswith("/")
+
+            if is_folder and is_parent and is_html:
+                children.append(urljoin(urlunparse(parent_url), url.path))
+                if is_date(link_text):
+                    break
+    return children
 
 
 def map_pages(function, parent_url, depth=10):
     """
-    Recursive map over child URLs of given parent URL.
+    Map over child URLs of given parent URL.
 
     Applies a given function over all sub-domains of a give URL whose link
-    name looks like a file path.
+    name looks like a file path. Pages are visited depth-first in the order
+    in which they are linked.
 
     Args:
          function: A function that is applied to the ``text`` attribute of
@@ -62,39 +104,25 @@ def map_pages(function, parent_url, depth=10):
               Results from this function is aggregated across all found sub-
               domains.
          parent_url: The URL from which to start the scraping.
+         depth: The maximum depth up to which to follow links.
 
-
+    Return:
+        List of ``(url, products)`` tuples containing the non-empty results
+        of ``function`` for each visited page.
     """
-    response = retrieve_page(parent_url)
-    soup = BeautifulSoup(response.text, features="lxml")
-
-    products = function(response.text)
-    if products:
-        results = [(parent_url, products)]
-    else:
-        results = []
-
-    #
-    # Search child pages.
-    #
-
-    parent_url = urlparse(parent_url)
-    for link in soup.find_all("a"):
-        url = urlparse(link["href"])
-        if not url.netloc:
-            child_path = Path(parent_url.path) / url.path
-            parent_path = Path(parent_url.path)
-            is_parent = parent_path in child_path.parents
-            is_html = str(child_path)[-5:].lower() == ".html"
-            is_folder = link.text[-1] == "/"
-
-            if is_folder and is_parent and is_html and depth > 0:
-                child_url = urljoin(urlunparse(parent_url), url.path)
-                new_depth = depth - 1
-                products = map_pages(function, child_url, depth=new_depth)
-                results += products
-                if is_date(link.text):
-                    break
+    results = []
+    stack = [(parent_url, depth)]
+    while stack:
+        url, depth = stack.pop()
+        response = retrieve_page(url)
+
+        products = function(response.text)
+        if products:
+            results.append((url, products))
+
+        if depth > 0:
+            children = get_child_pages(url, response.text)
+            stack.extend((child, depth - 1) for child in reversed(children))
 
     return results
 
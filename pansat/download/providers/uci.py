@@ -6,17 +6,26 @@ Provider to download PERSIANN files from servers of the University
 of California, Irvine.
 """
 from datetime import datetime, timedelta
-from urllib.request import urlopen
+from html import unescape
 from pathlib import Path
+import re
 
-from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
 
 from pansat.download.providers.discrete_provider import DiscreteProvider
 
 BASE_URL = "http://persiann.eng.uci.edu/CHRSdata/"
 _CACHE = {}
 
+# Extracts link targets from a web page.
+HREF_REGEXP = re.compile(rb'<a\s[^>]*?\bhref="([^"]*)"', re.IGNORECASE)
+
+# Session shared by all requests to the UCI server.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
 
 def get_links(url):
     """
@@ -30,12 +39,10 @@ def get_links(url):
         the given URL.
     """
     if url not in _CACHE:
-        html = urlopen(url).read()
-        soup = BeautifulSoup(html, features="html.parser")
-        files = []
-        for link in soup.findAll("a"):
-            files.append(link.get("href"))
-        _CACHE[url] = files
+        response = _SESSION.get(url)
+        response.raise_for_status()
+        links = HREF_REGEXP.findall(response.content)
+        _CACHE[url] = [unescape(link.decode()) for link in links]
     files = _CACHE[url]
     return files
 
@@ -47,6 +54,8 @@ class UciProvider(DiscreteProvider):
     Remote Sensing.
     """
 
+    max_workers = 4
+
     @classmethod
     def get_available_products(cls):
         return ["PDIRNow", "PERSIANN-CCS", "PERSIANN-CDR"]
@@ -88,6 +97,27 @@ class UciProvider(DiscreteProvider):
                 pass
         return files
 
+    def get_files_by_days(self, days):
+        """
+        Return lists of available files for multiple days.
+
+        Listings are organized by year, so the listing of each year is
+        retrieved only once before the files are split up by day. Listings
+        of different years are retrieved concurrently.
+
+        Args:
+            days: Iterable of ``(year, day)`` tuples identifying the days
+                for which to look up the files.
+
+        Return:
+            A list containing the list of available files for each of the
+            given days.
+        """
+        days = list(days)
+        urls = dict.fromkeys(BASE_URL + self.product.get_path(year) for year, _ in days)
+        self._map(get_links, urls)
+        return [self.get_files_by_day(year, day) for year, day in days]
+
     def download_file(self, filename, destination):
         """
         Download a given file.
@@ -100,7 +130,7 @@ class UciProvider(DiscreteProvider):
         date = self.product.filename_to_date(filename)
         year = date.year
         url = BASE_URL + self.product.get_path(year) + "/" + filename
-        response = requests.get(url)
-        with open(destination, "wb") as output:
-            for chunk in response:
-                output.write(chunk)
+        with _SESSION.get(url, stream=True) as response:
+            with open(destination, "wb") as output:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    output.write(chunk)
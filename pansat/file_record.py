@@ -7,6 +7,7 @@ file.
 """
 from dataclasses import dataclass
 from pathlib import Path
+import sys
 
 
 @dataclass
@@ -17,10 +18,26 @@ class FileRecord:
     """
 
     product: "pansat.products.Product"
-    filename: str
     local_path: Path = None
+    filename: str = None
     remote_path: str = None
 
+    def __post_init__(self):
+        """
+        Ensure that the local path is a 'Path' object and derive the filename
+        from it if no filename was given. Filenames are interned so that
+        records of the same file share a single string.
+        """
+        local_path = self.local_path
+        if local_path is not None:
+            if not isinstance(local_path, Path):
+                local_path = Path(local_path)
+                self.local_path = local_path
+            if self.filename is None:
+                self.filename = local_path.name
+        if self.filename is not None:
+            self.filename = sys.intern(str(self.filename))
+
     @staticmethod
     def from_remote(
         product: "pansat.products.Product", remote_path: str, filename: str
@@ -37,21 +54,4 @@ class FileRecord:
         Return:
             A 'FileRecord' object representing the file.
         """
-        rec = FileRecord(product, None)
-        rec.remote_path = remote_path
-        rec.filename = filename
-        return rec
-
-    def __init__(self, product, local_path):
-        """
-        Create file record from product and local file path.
-
-        Args:
-            product: A pansat product representing the data product.
-            local_path: The local path of the file.
-        """
-        self.product = product
-        local_path = Path(local_path)
-        self.filename = local_path.name
-        self.local_path = local_path
-        self.remote_path = None
+        return FileRecord(product, filename=filename, remote_path=remote_path)
@@ -20,19 +20,17 @@ as simple as shown below:
     data = file.variable_1[:]  # Read data from variable named `variable_1`
 
 """
+import importlib.util
+import os
 import weakref
 import numpy as np
 import logging
 
 LOGGER = logging.getLogger(__name__)
 
-try:
-    from pyhdf.HDF import HDF
-    from pyhdf.SD import SD
-    from pyhdf.VS import VS
-except ImportError as error:
-    LOGGER.error("The pyhdf package is required to read HDF4 file. Please install it.")
-    raise error
+# pyhdf is only imported when the first file is opened, so that this module
+# can be imported without it.
+_HAS_PYHDF = importlib.util.find_spec("pyhdf") is not None
 
 
 class VData:
@@ -79,6 +77,7 @@ class VData:
         self.size = size
         self.tag = tag
         self.interlace = interlace
+        self._vs_handle = None
 
     def __repr__(self):
         return f"VData({self.name}, [{self.n_records}, {self.n_fields}])"
@@ -91,9 +90,21 @@ class VData:
         Selects datasets from file and forwards call to the returned vdata
         object.
         """
-        data = self.file().vdata_table.attach(self.name).__getitem__(*args)
+        handle = self._vs_handle
+        if handle is None:
+            handle = self.file().vdata_table.attach(self.name)
+            self._vs_handle = handle
+        data = handle.__getitem__(*args)
         return np.array(data)
 
+    def close(self):
+        """
+        Detach the vdata object if it has been accessed.
+        """
+        if self._vs_handle is not None:
+            self._vs_handle.detach()
+            self._vs_handle = None
+
 
 class Dataset:
     """
@@ -120,6 +131,7 @@ class Dataset:
         self.shape = shape
         self.hdf_type = hdf_type
         self.index = index
+        self._sds_handle = None
 
     def __repr__(self):
         return f"Dataset({self.name}, {self.dimensions}, {self.shape})"
@@ -132,8 +144,19 @@ class Dataset:
         Selects datasets from file and forwards call to the returned dataset
         object.
         """
-        file = self.file()
-        return file.scientific_dataset.select(self.name).__getitem__(*args)
+        handle = self._sds_handle
+        if handle is None:
+            handle = self.file().scientific_dataset.select(self.name)
+            self._sds_handle = handle
+        return handle.__getitem__(*args)
+
+    def close(self):
+        """
+        End access to the dataset if it has been accessed.
+        """
+        if self._sds_handle is not None:
+            self._sds_handle.endaccess()
+            self._sds_handle = None
 
 
 class HDF4File:
@@ -143,58 +166,146 @@ class HDF4File:
     """
 
     # Attributes:
-    #     variables(``list``): List of strings of variable names contained in
+    #     variables(``tuple``): Tuple of strings of variable names contained in
     #         this file.
 
     def __init__(self, path):
+        if not _HAS_PYHDF:
+            raise ImportError(
+                "The pyhdf package is required to read HDF4 files. Please install it."
+            )
         self.path = path
-        self.file_handle = HDF(str(path))
-
-        self.scientific_dataset = SD(str(path))
-        datasets = self.scientific_dataset.datasets()
-        dataset_dict = {
-            key: Dataset(weakref.ref(self), key, *info)
-            for key, info in datasets.items()
-        }
-        self.datasets = dataset_dict
-
-        self.vdata_table = VS(self.file_handle)
-        vdata_dict = {
-            info[0]: VData(weakref.ref(self), *info)
-            for info in self.vdata_table.vdatainfo()
-        }
-        self.vdata = vdata_dict
+        self._filename = os.fspath(path)
+        # The SD and VS interfaces are only opened when they are first
+        # accessed.
+        self._file_handle = None
+        self._scientific_dataset = None
+        self._vdata_table = None
+        self._datasets = None
+        self._vdata = None
+        self._variables = None
+
+    @property
+    def file_handle(self):
+        """
+        The ``pyhdf.HDF.HDF`` handle of the file.
+        """
+        if self._file_handle is None:
+            from pyhdf.HDF import HDF
+
+            self._file_handle = HDF(self._filename)
+        return self._file_handle
+
+    @property
+    def scientific_dataset(self):
+        """
+        The SD interface of the file.
+        """
+        if self._scientific_dataset is None:
+            from pyhdf.SD import SD
+
+            self._scientific_dataset = SD(self._filename)
+        return self._scientific_dataset
+
+    @property
+    def vdata_table(self):
+        """
+        The VS interface of the file.
+        """
+        if self._vdata_table is None:
+            from pyhdf.VS import VS
+
+            self._vdata_table = VS(self.file_handle)
+        return self._vdata_table
+
+    @property
+    def datasets(self):
+        """
+        Dictionary mapping dataset names to the ``Dataset`` objects of the
+        file.
+        """
+        if self._datasets is None:
+            datasets = self.scientific_dataset.datasets()
+            self._datasets = {
+                key: Dataset(weakref.ref(self), key, *info)
+                for key, info in datasets.items()
+            }
+        return self._datasets
+
+    @property
+    def vdata(self):
+        """
+        Dictionary mapping vdata names to the ``VData`` objects of the file.
+        """
+        if self._vdata is None:
+            self._vdata = {
+                info[0]: VData(weakref.ref(self), *info)
+                for info in self.vdata_table.vdatainfo()
+            }
+        return self._vdata
 
     def __del__(self):
-        if self.file_handle:
-            self.file_handle.close()
-            self.file_handle = None
+        # Handles of accessed variables must be released before the
+        # interfaces they belong to are closed.
+        for dataset in (self.__dict__.get("_datasets") or {}).values():
+            dataset.close()
+        for vdata in (self.__dict__.get("_vdata") or {}).values():
+            vdata.close()
+        file_handle = self.__dict__.get("_file_handle")
+        if file_handle:
+            file_handle.close()
+            self._file_handle = None
+
+    def prefetch(self):
+        """
+        Advise the operating system that the file will be read, so that its
+        content is read into the page cache ahead of the reads of the
+        individual variables. Does nothing on systems that don't support
+        ``posix_fadvise``.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        file_descriptor = os.open(self._filename, os.O_RDONLY)
+        try:
+            os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(file_descriptor)
 
     @property
     def variables(self):
         """
-        Names of the variables available in this file.
+        Tuple containing the names of the variables available in this file.
         """
-        return list(self.datasets.keys()) + list(self.vdata.keys())
+        if self._variables is None:
+            self._variables = tuple(self.datasets) + tuple(self.vdata)
+        return self._variables
+
+    def __getattr__(self, name):
+        # Only called if regular attribute lookup fails. Special attributes
+        # and lookups on partially initialized objects are not forwarded to
+        # the file.
+        if name.startswith("__") or "_datasets" not in self.__dict__:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        variable = self.datasets.get(name)
+        if variable is None:
+            variable = self.vdata.get(name)
+        if variable is not None:
+            # Bind variable to the instance so that following lookups don't
+            # end up here.
+            self.__dict__[name] = variable
+            return variable
 
-    def __getattribute__(self, name):
         try:
-            return object.__getattribute__(self, name)
-        except AttributeError as error:
-            datasets = object.__getattribute__(self, "datasets")
-            if name in datasets:
-                return datasets[name]
-            vdata = object.__getattribute__(self, "vdata")
-            if name in vdata:
-                return vdata[name]
-
-            print(name, self.scientific_dataset)
-            try:
-                return getattr(self.scientific_dataset, name)
-            except AttributeError:
-                pass
-
-            raise error
+            return getattr(self.scientific_dataset, name)
+        except AttributeError:
+            pass
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     def __repr__(self):
         return f"HDF4File({self.path})"
@@ -6,13 +6,20 @@ This module extends the ``File`` class from the ``h5py`` module to provide
 access datasets via the ``getattr`` function, which is required by the
 Product description interface to turn HDF5 files into xarray Datasets.
 """
+import logging
 import weakref
 import numpy as np
 
+LOGGER = logging.getLogger(__name__)
+
+# Initial size of the metadata cache of opened files in bytes.
+MDC_INITIAL_SIZE = 16 * 2 ** 20
+
+# HDF5File derives from h5py.File, so h5py can't be imported lazily.
 try:
     from h5py import File
 except ImportError as error:
-    print("The h5py package is required to read HDF5 files. Please install it.")
+    LOGGER.error("The h5py package is required to read HDF5 files. Please install it.")
     raise error
 
 
@@ -25,6 +32,13 @@ class HDF5File(File):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Start with a large metadata cache so that the metadata of the
+        # datasets read by product descriptions is only read once.
+        config = self.id.get_mdc_config()
+        if config.initial_size < MDC_INITIAL_SIZE:
+            config.set_initial_size = True
+            config.initial_size = min(MDC_INITIAL_SIZE, config.max_size)
+            self.id.set_mdc_config(config)
 
     def __getattr__(self, attr):
         value = File.__getitem__(self, attr)
@@ -6,6 +6,8 @@ The pansat geometry provides functions to represent the spatial coverage
 of data files using geometrical objects.
 """
 import numpy as np
+import shapely
+import shapely.errors
 from shapely.geometry import Polygon, MultiPolygon
 from shapely.validation import make_valid
 from shapely.ops import unary_union
@@ -84,22 +86,35 @@ def handle_poles(polygons):
         polygons: A list of shapely polygons.
 
     Return:
-        The list of polygons with offending Polygons replaced.
+        The union of the polygons with offending Polygons replaced.
     """
-    for ind in range(len(polygons)):
-        poly = polygons[ind]
-        points = np.stack(poly.exterior.coords.xy, -1)
-        if any(points[:, 1] > 70):
-            poly_2 = Polygon([[-180, 75], [180, 75], [180, 90], [-180, 90]])
-            polygons[ind] = poly_2
-        if any(points[:, 1] < -70):
-            poly_2 = Polygon([[-180, -75], [180, -75], [180, -90], [-180, -90]])
-            polygons[ind] = poly_2
-
-    poly = polygons[0]
-    for other in polygons[1:]:
-        poly = poly.union(other)
-    return poly
+    polygons = np.array(polygons, dtype=object)
+    bounds = shapely.bounds(polygons)
+    north = bounds[:, 3] > 70
+    south = bounds[:, 1] < -70
+    polygons[north] = Polygon([[-180, 75], [180, 75], [180, 90], [-180, 90]])
+    polygons[south] = Polygon([[-180, -75], [180, -75], [180, -90], [-180, -90]])
+
+    # Valid tiles that neither touch the poles nor cross the antimeridian
+    # should only share edges, so they can be merged with the much faster
+    # coverage union. If they overlap nonetheless, the coverage union fails
+    # or yields an invalid result and all polygons are merged using a
+    # regular union.
+    regular = (
+        ~(north | south)
+        & (bounds[:, 2] - bounds[:, 0] < 180)
+        & shapely.is_valid(polygons)
+        & (shapely.area(polygons) > 0)
+    )
+    try:
+        merged = shapely.coverage_union_all(polygons[regular])
+    except shapely.errors.GEOSException:
+        merged = None
+    if merged is None or not merged.is_valid:
+        return unary_union(polygons)
+    if regular.all():
+        return merged
+    return unary_union(list(polygons[~regular]) + [merged])
 
 
 def parse_swath(lons, lats, m=10, n=1) -> MultiPolygon:
@@ -119,34 +134,25 @@ def parse_swath(lons, lats, m=10, n=1) -> MultiPolygon:
     n_j = lons.shape[1]
     d_i = n_i // m
     d_j = n_j // n
-    ind_i = 0
-
-    polys = []
-
-    while ind_i < lons.shape[0]:
-        ind_j = 0
-        while ind_j < lons.shape[1]:
-            lon_0_0 = lons[ind_i, ind_j]
-            lat_0_0 = lats[ind_i, ind_j]
-            lon_0_1 = lons[ind_i, min(ind_j + d_j, n_j - 1)]
-            lat_0_1 = lats[ind_i, min(ind_j + d_j, n_j - 1)]
-            lon_1_1 = lons[min(ind_i + d_i, n_i - 1), min(ind_j + d_j, n_j - 1)]
-            lat_1_1 = lats[min(ind_i + d_i, n_i - 1), min(ind_j + d_j, n_j - 1)]
-            lon_1_0 = lons[min(ind_i + d_i, n_i - 1), ind_j]
-            lat_1_0 = lats[min(ind_i + d_i, n_i - 1), ind_j]
-
-            polys.append(
-                Polygon(
-                    [
-                        [lon_0_0, lat_0_0],
-                        [lon_0_1, lat_0_1],
-                        [lon_1_1, lat_1_1],
-                        [lon_1_0, lat_1_0],
-                        [lon_0_0, lat_0_0],
-                    ]
-                )
-            )
-            ind_j += d_j
-        ind_i += d_i
+
+    # Indices of the corners of all tiles.
+    ind_i_0 = np.arange(0, n_i, d_i)
+    ind_i_1 = np.minimum(ind_i_0 + d_i, n_i - 1)
+    ind_j_0 = np.arange(0, n_j, d_j)
+    ind_j_1 = np.minimum(ind_j_0 + d_j, n_j - 1)
+    ind_i_0 = ind_i_0[:, None]
+    ind_i_1 = ind_i_1[:, None]
+
+    corners = [
+        (ind_i_0, ind_j_0),
+        (ind_i_0, ind_j_1),
+        (ind_i_1, ind_j_1),
+        (ind_i_1, ind_j_0),
+    ]
+    coords = np.stack(
+        [np.stack([lons[ind], lats[ind]], -1) for ind in corners], -2
+    ).reshape(-1, 4, 2)
+    polys = shapely.polygons(coords)
+
     poly = handle_poles(polys)
     return make_valid(poly)
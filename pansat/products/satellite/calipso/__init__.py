@@ -131,6 +131,7 @@ class CalipsoProduct(Product):
         from pansat.formats.hdf4 import HDF4File
 
         file_handle = HDF4File(filename)
+        file_handle.prefetch()
         return self.description.to_xarray_dataset(file_handle, globals())
 
 
@@ -6,6 +6,7 @@ This module defines the NOAA GridSat products.
 """
 from datetime import datetime
 from pathlib import Path
+import re
 
 from pansat.download import providers
 from pansat.exceptions import NoAvailableProvider
@@ -22,6 +23,24 @@ class GridsatProduct:
             variant: The variant of the GridSat product: 'conus' or 'goes'.
         """
         self.variant = variant
+        self.filename_regexp = re.compile(
+            rf"GridSat-{self.variant.upper()}\.\w+\."
+            r"\d{4}\.\d{2}\.\d{2}\.\d{4}\..*\.nc",
+            re.IGNORECASE,
+        )
+
+    def matches(self, filename):
+        """
+        Determines whether a given filename matches the pattern used for
+        the product.
+
+        Args:
+            filename(``str``): The filename
+
+        Return:
+            True if the filename matches the product, False otherwise.
+        """
+        return self.filename_regexp.match(filename) is not None
 
     def filename_to_date(self, filename):
         """
@@ -99,6 +118,9 @@ class GridsatB1(GridsatProduct):
     def __init__(self):
         """Create product."""
         super().__init__("b1")
+        self.filename_regexp = re.compile(
+            r"GridSat-B1\.\d{4}\.\d{2}\.\d{2}\.\d{2}\..*\.nc", re.IGNORECASE
+        )
 
     def filename_to_date(self, filename):
         """
@@ -6,7 +6,6 @@ This module provides functionality for dealing with times.
 """
 from datetime import datetime
 from dataclasses import dataclass
-import pandas as pd
 import numpy as np
 
 
@@ -16,6 +15,9 @@ def to_datetime(time):
     """
     if isinstance(time, datetime):
         return time
+    # pandas is slow to import, so it is only imported when needed.
+    import pandas as pd
+
     try:
         return pd.to_datetime(time).to_pydatetime()
     except ValueError:
@@ -28,6 +30,8 @@ def to_datetime64(time):
     """
     if isinstance(time, np.ndarray) and time.dtype == np.datetime64:
         return time
+    import pandas as pd
+
     try:
         return pd.to_datetime(time).to_datetime64()
     except ValueError:
@@ -22,12 +22,13 @@ setuptools.setup(
         "numpy",
         "cdsapi",
         "requests",
+        "urllib3>=1.26",
         "xarray",
         "pyproj",
         "appdirs",
         "boto3",
         "paramiko",
-        "shapely"
+        "shapely>=2.0"
     ],
     setup_requires=["pytest-runner"],
     tests_require=[
@@ -35,8 +36,6 @@ setuptools.setup(
         "pytest",
         "appdirs",
         "scipy",
-        "beautifulsoup4",
-        "lxml",
         "netcdf4",
     ],
     python_requires=">=3.7",
@@ -2,8 +2,15 @@
 Contains fixtures that are automatically available in all test files.
 """
 
-import pytest
 from pathlib import PurePath, Path
+import threading
+
+import pytest
+import requests
+
+# Time for which the first request for a listing is held open by the fake
+# listing server to wait for duplicate requests.
+HOLD_TIMEOUT = 0.5
 
 
 @pytest.fixture()
@@ -20,3 +27,75 @@ def test_identities(monkeypatch):
     import pansat.download.accounts as accs
 
     accs.parse_identity_file()
+
+
+class FakeResponse:
+    """
+    Minimal stand-in for a ``requests.Response``.
+    """
+
+    def __init__(self, content, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(str(self.status_code))
+
+
+class ListingServer:
+    """
+    Fake server providing HTML directory listings of generated filenames.
+
+    The first request for each listing is held open until a second request
+    for the same listing arrives or 'HOLD_TIMEOUT' expires. Concurrent
+    duplicate requests thus always overlap and are all recorded in
+    'requested'.
+    """
+
+    def __init__(self, get_filenames):
+        self.get_filenames = get_filenames
+        self.requested = []
+        self._duplicates = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.requested.append(url)
+            duplicate = self._duplicates.get(url)
+            if duplicate is None:
+                duplicate = threading.Event()
+                self._duplicates[url] = duplicate
+                first = True
+            else:
+                duplicate.set()
+                first = False
+        if first:
+            duplicate.wait(HOLD_TIMEOUT)
+        links = [f'<a href="{name}">{name}</a>' for name in self.get_filenames(url)]
+        return FakeResponse("\n".join(links).encode())
+
+
+@pytest.fixture()
+def fake_response():
+    """
+    Fixture providing the 'FakeResponse' class.
+    """
+    return FakeResponse
+
+
+@pytest.fixture()
+def listing_server(monkeypatch):
+    """
+    Fixture to serve directory listings from a 'ListingServer'. Call the
+    returned function with the session to patch and a function returning
+    the filenames listed at a given URL.
+    """
+
+    def serve(session, get_filenames):
+        server = ListingServer(get_filenames)
+        monkeypatch.setattr(session, "get", server.get)
+        return server
+
+    return serve
@@ -2,8 +2,17 @@
 Test for CloudSat DPC provider.
 """
 import os
+from types import SimpleNamespace
+
 import pytest
-from pansat.download.providers.cloudsat_dpc import CloudSatDPCProvider
+from pansat.download.providers import cloudsat_dpc
+from pansat.download.providers.cloudsat_dpc import (
+    CloudSatDPCProvider,
+    SFTPConnection,
+    get_connection,
+    release_connection,
+    sftp_connection,
+)
 from pansat.products.satellite.cloud_sat import l2c_ice
 
 
@@ -24,3 +33,167 @@ def test_cloudsat_dpc_provider():
     filename = files[0]
     date = l2c_ice.filename_to_date(filename)
     assert date.day == 10
+
+
+class FakeTransport:
+    """
+    Stand-in for ``paramiko.Transport`` that doesn't connect anywhere.
+    """
+
+    def __init__(self, host, **kwargs):
+        self.host = host
+        self.active = True
+
+    def connect(self, username=None, pkey=None):
+        pass
+
+    def is_active(self):
+        return self.active
+
+    def send_ignore(self):
+        pass
+
+    def close(self):
+        self.active = False
+
+
+class FakeSFTPClient:
+    """
+    Stand-in for ``paramiko.SFTPClient`` serving directory listings from
+    the ``DIRECTORIES`` dictionary and recording all created clients.
+    """
+
+    DIRECTORIES = {"/Data/a": ["file_1", "file_2"], "/Data/b": ["file_3"]}
+    clients = []
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.closed = False
+
+    @classmethod
+    def from_transport(cls, transport):
+        client = cls(transport)
+        cls.clients.append(client)
+        return client
+
+    def listdir(self, path):
+        try:
+            return list(self.DIRECTORIES[path])
+        except KeyError:
+            raise FileNotFoundError(path)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    """
+    Replacement for the 'time' module with a manually advanced clock.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_sftp(monkeypatch, tmp_path):
+    """
+    Replaces paramiko and the pansat identities used by the CloudSat DPC
+    provider with fakes and provides empty connection pools.
+    """
+    key_file = tmp_path / "key"
+    key_file.write_text("key")
+    monkeypatch.setattr(cloudsat_dpc, "get_identity", lambda p: ("user", key_file))
+    fake_paramiko = SimpleNamespace(
+        RSAKey=SimpleNamespace(from_private_key=lambda buffer: object()),
+        Transport=FakeTransport,
+        SFTPClient=FakeSFTPClient,
+    )
+    monkeypatch.setattr(cloudsat_dpc, "paramiko", fake_paramiko)
+    monkeypatch.setattr(FakeSFTPClient, "clients", [])
+    monkeypatch.setattr(cloudsat_dpc, "_POOLS", {})
+    clock = FakeClock()
+    monkeypatch.setattr(cloudsat_dpc, "time", clock)
+    return clock
+
+
+def test_pool_reuses_last_connection(fake_sftp):
+    """
+    Ensure that released connections are reused with the most recently
+    released connection first.
+    """
+    connection_1 = get_connection("host", "provider")
+    connection_2 = get_connection("host", "provider")
+    assert connection_1 is not connection_2
+
+    release_connection(connection_1)
+    release_connection(connection_2)
+    assert get_connection("host", "provider") is connection_2
+    assert get_connection("host", "provider") is connection_1
+
+    # Connections are pooled per host.
+    release_connection(connection_1)
+    assert get_connection("other_host", "provider") is not connection_1
+
+
+def test_pool_evicts_idle_and_inactive_connections(fake_sftp):
+    """
+    Ensure that connections that have been idle for too long or whose
+    transport has been closed are closed instead of reused.
+    """
+    connection = get_connection("host", "provider")
+    transport = connection.transport
+    release_connection(connection)
+    fake_sftp.now += cloudsat_dpc.MAX_IDLE_TIME + 1
+
+    new_connection = get_connection("host", "provider")
+    assert new_connection is not connection
+    assert not transport.is_active()
+    assert connection.transport is None
+
+    transport = new_connection.transport
+    release_connection(new_connection)
+    transport.close()
+    assert get_connection("host", "provider") is not new_connection
+    assert new_connection.transport is None
+
+
+def test_connection_closed_on_exception(fake_sftp):
+    """
+    Ensure that a connection used in a 'with' block that raises an exception
+    is closed and not returned to the pool.
+    """
+    with sftp_connection("host", "provider") as connection:
+        pass
+    assert get_connection("host", "provider") is connection
+    release_connection(connection)
+
+    transport = connection.transport
+    with pytest.raises(ValueError):
+        with sftp_connection("host", "provider") as connection:
+            raise ValueError()
+    assert not transport.is_active()
+    assert get_connection("host", "provider") is not connection
+
+
+def test_map_channels_closes_clients(fake_sftp):
+    """
+    Ensure that listing multiple directories concurrently closes the
+    additional SFTP clients but not the connection's own client, and that
+    missing directories yield empty lists.
+    """
+    connection = SFTPConnection("host", "provider")
+    paths = ["/Data/a", "/Data/b", "/Data/missing", "/Data/a"]
+    files = connection.list_files_many(paths)
+    assert files == [["file_1", "file_2"], ["file_3"], [], ["file_1", "file_2"]]
+
+    clients = FakeSFTPClient.clients
+    assert len(clients) == len(paths)
+    assert clients[0] is connection.sftp
+    assert not connection.sftp.closed
+    assert all(client.closed for client in clients[1:])
+
+    assert connection.list_files_many(["/Data/missing"]) == [[]]
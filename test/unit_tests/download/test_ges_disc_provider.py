@@ -1,9 +1,12 @@
 """
 Test for NASA GES DISC provider.
 """
+import io
 import os
+import stat
+
 import pytest
-from pansat.download.providers.ges_disc import GesdiscProvider
+from pansat.download.providers.ges_disc import GesdiscProvider, _write_response
 from pansat.products.satellite.gpm import l2a_dpr
 
 
@@ -27,3 +30,31 @@ def test_ges_disc_provider():
     date = l2a_dpr.filename_to_date(file)
     date_file = data_provider.get_file_by_date(date)
     assert date_file == file
+
+
+class FakeResponse:
+    """
+    Minimal stand-in for a streamed ``requests.Response``.
+    """
+
+    def __init__(self, content):
+        self.raw = io.BytesIO(content)
+        self.headers = {}
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Requires POSIX permissions.")
+def test_write_response_permissions(tmp_path):
+    """
+    Ensure that downloaded files are written completely and get the
+    default permissions for new files.
+    """
+    destination = tmp_path / "file.nc"
+    umask = os.umask(0o022)
+    try:
+        _write_response(FakeResponse(b"data"), destination)
+    finally:
+        os.umask(umask)
+
+    assert destination.read_bytes() == b"data"
+    assert stat.S_IMODE(destination.stat().st_mode) == 0o644
+    assert list(tmp_path.iterdir()) == [destination]
@@ -1,7 +1,11 @@
 """
 Test for NOAA NCEI provider.
 """
-import pytest
+from collections import OrderedDict
+from datetime import datetime
+from types import SimpleNamespace
+
+from pansat.download.providers import noaa_ncei
 from pansat.download.providers.noaa_ncei import NOAANCEIProvider
 from pansat.products.satellite.gridsat import gridsat_goes, gridsat_b1
 
@@ -17,3 +21,85 @@ def test_noaa_ncei_provider():
     data_provider = NOAANCEIProvider(gridsat_b1)
     files = data_provider.get_files_by_day(2016, 10)
     assert len(files) == 8
+
+
+def gridsat_goes_files(url):
+    """
+    Names of GridSat GOES files for every three hours of the month listed
+    at the given URL.
+    """
+    year, month = map(int, url.split("/")[-2:])
+    return [
+        f"GridSat-GOES.goes13.{year:04}.{month:02}.{day:02}.{hour:02}00.v01.nc"
+        for day in range(1, 29)
+        for hour in range(0, 24, 3)
+    ]
+
+
+def test_listings_retrieved_once(monkeypatch, listing_server):
+    """
+    Ensure that each monthly listing is retrieved only once for a range of
+    days.
+    """
+    server = listing_server(noaa_ncei._SESSION, gridsat_goes_files)
+    monkeypatch.setattr(noaa_ncei, "_LISTINGS", OrderedDict())
+    data_provider = NOAANCEIProvider(gridsat_goes)
+    files = data_provider.get_files_in_range(datetime(2019, 1, 5), datetime(2019, 2, 2))
+
+    assert len(server.requested) == 2
+    assert len(set(server.requested)) == 2
+    assert len(files) == 8 * 24 + 8 + 1
+
+
+def test_listings_revalidated(monkeypatch, fake_response):
+    """
+    Ensure that cached listings are reused for 'LISTING_TTL' seconds and
+    revalidated with a conditional request afterwards.
+    """
+    url = "https://www.ncei.noaa.gov/data/listing"
+    listing = b'<a href="file_1.nc">file_1.nc</a>\n<a href="file_2.nc">file_2.nc</a>'
+    requests_headers = []
+    responses = [
+        fake_response(listing, headers={"ETag": '"abc"'}),
+        fake_response(b"", status_code=304),
+    ]
+
+    def get(url, headers=None, **kwargs):
+        requests_headers.append(headers)
+        return responses.pop(0)
+
+    now = [0.0]
+    monkeypatch.setattr(noaa_ncei._SESSION, "get", get)
+    monkeypatch.setattr(noaa_ncei, "_LISTINGS", OrderedDict())
+    monkeypatch.setattr(noaa_ncei, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    links = noaa_ncei.get_links(url)
+    assert links == ("file_1.nc", "file_2.nc")
+    assert requests_headers == [{}]
+
+    now[0] = noaa_ncei.LISTING_TTL - 1
+    assert noaa_ncei.get_links(url) == links
+    assert len(requests_headers) == 1
+
+    now[0] = noaa_ncei.LISTING_TTL + 1
+    assert noaa_ncei.get_links(url) == links
+    assert requests_headers[1] == {"If-None-Match": '"abc"'}
+
+    # The revalidated listing is reused for another 'LISTING_TTL' seconds.
+    now[0] = 2 * noaa_ncei.LISTING_TTL
+    assert noaa_ncei.get_links(url) == links
+    assert len(requests_headers) == 2
+
+
+def test_listing_cache_bounded(monkeypatch, fake_response):
+    """
+    Ensure that the number of cached listings is limited to 'MAX_LISTINGS'.
+    """
+    monkeypatch.setattr(
+        noaa_ncei._SESSION, "get", lambda url, **kwargs: fake_response(b"")
+    )
+    monkeypatch.setattr(noaa_ncei, "_LISTINGS", OrderedDict())
+    for index in range(noaa_ncei.MAX_LISTINGS + 10):
+        noaa_ncei.get_links(f"https://www.ncei.noaa.gov/data/{index}")
+    assert len(noaa_ncei._LISTINGS) == noaa_ncei.MAX_LISTINGS
+    assert "https://www.ncei.noaa.gov/data/0" not in noaa_ncei._LISTINGS
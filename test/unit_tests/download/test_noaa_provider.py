@@ -0,0 +1,68 @@
+"""
+Test for the NOAA provider.
+"""
+import threading
+
+from pansat.download.providers import noaa
+from pansat.download.providers.noaa import NOAAProvider
+from pansat.products.reanalysis.ncep import NCEPReanalysis
+
+
+class FakeFTP:
+    """
+    Stand-in for ``ftplib.FTP`` that records connections and serves the
+    name of each requested file as its content.
+    """
+
+    connections = []
+    lock = threading.Lock()
+
+    def __init__(self, host):
+        self.host = host
+        self.logins = 0
+        self.retrieved = []
+        self.closed = False
+        with self.lock:
+            self.connections.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+    def login(self, user=None, passwd=None):
+        self.logins += 1
+
+    def cwd(self, path):
+        self.path = path
+
+    def retrbinary(self, command, callback, blocksize=None):
+        filename = command.split(" ")[1]
+        self.retrieved.append(filename)
+        callback(filename.encode())
+
+
+def test_ftp_connection_per_worker(monkeypatch, tmp_path):
+    """
+    Ensure that FTP downloads use one logged-in connection per worker
+    instead of one per file, close all connections and return the
+    downloaded files in order.
+    """
+    monkeypatch.setattr(FakeFTP, "connections", [])
+    monkeypatch.setattr(noaa.ftplib, "FTP", FakeFTP)
+    monkeypatch.setattr(noaa, "get_identity", lambda provider: ("user", "pw"))
+
+    provider = NOAAProvider(NCEPReanalysis("air", "pressure"))
+    files = [f"air.{year}.nc" for year in range(1980, 2020)]
+    downloaded = provider.download(1980, 2019, destination=tmp_path, files=files)
+
+    assert downloaded == [str(tmp_path / filename) for filename in files]
+    assert all((tmp_path / filename).read_text() == filename for filename in files)
+
+    connections = FakeFTP.connections
+    assert 1 <= len(connections) <= noaa.MAX_CONNECTIONS
+    assert all(connection.logins == 1 for connection in connections)
+    assert all(connection.closed for connection in connections)
+    retrieved = sum((connection.retrieved for connection in connections), [])
+    assert sorted(retrieved) == files
@@ -0,0 +1,37 @@
+"""
+Test for the UCI provider.
+"""
+from datetime import datetime
+
+from pansat.download.providers import uci
+from pansat.download.providers.uci import UciProvider
+from pansat.products.satellite.persiann import PDIRNow
+
+
+def pdirnow_files(url):
+    """
+    Names of hourly PDIRNow files for every hour of January of the year
+    listed at the given URL.
+    """
+    year = int(url.split("/")[-1])
+    return [
+        f"pdirnow1h{year % 100:02}01{day:02}{hour:02}.bin.gz"
+        for day in range(1, 32)
+        for hour in range(24)
+    ]
+
+
+def test_listings_retrieved_once(monkeypatch, listing_server):
+    """
+    Ensure that the yearly listing is retrieved only once for a range of
+    days.
+    """
+    server = listing_server(uci._SESSION, pdirnow_files)
+    monkeypatch.setattr(uci, "_CACHE", {})
+    data_provider = UciProvider(PDIRNow())
+    files = data_provider.get_files_in_range(
+        datetime(2019, 1, 5), datetime(2019, 1, 25)
+    )
+
+    assert server.requested == [uci.BASE_URL + "PDIRNow/PDIRNow1hourly/2019"]
+    assert len(files) == 20 * 24 + 1
@@ -0,0 +1,93 @@
+"""
+Tests for the ``pansat.geometry`` module.
+"""
+import numpy as np
+import pytest
+from shapely.geometry import Polygon, box
+from shapely.ops import unary_union
+from shapely.validation import make_valid
+
+from pansat.geometry import handle_poles, parse_swath
+
+
+def parse_swath_reference(lons, lats, m=10, n=1):
+    """
+    Reference implementation of 'parse_swath' that merges the tiles of the
+    swath using a plain unary union.
+    """
+    n_i, n_j = lons.shape
+    d_i = n_i // m
+    d_j = n_j // n
+    polys = []
+    for i_0 in range(0, n_i, d_i):
+        i_1 = min(i_0 + d_i, n_i - 1)
+        for j_0 in range(0, n_j, d_j):
+            j_1 = min(j_0 + d_j, n_j - 1)
+            corners = [(i_0, j_0), (i_0, j_1), (i_1, j_1), (i_1, j_0)]
+            poly = Polygon([(lons[ind], lats[ind]) for ind in corners])
+            if poly.bounds[3] > 70:
+                poly = Polygon([[-180, 75], [180, 75], [180, 90], [-180, 90]])
+            if poly.bounds[1] < -70:
+                poly = Polygon([[-180, -75], [180, -75], [180, -90], [-180, -90]])
+            polys.append(poly)
+    return make_valid(unary_union(polys))
+
+
+def make_swath(lon_0, lat_0, lat_1, n_i=200, n_j=20):
+    """
+    Create coordinates of a slanted swath.
+    """
+    lats = np.linspace(lat_0, lat_1, n_i)[:, None] + np.linspace(0, 3, n_j)[None]
+    lons = np.linspace(lon_0, lon_0 + 10, n_j)[None] + np.linspace(0, 5, n_i)[:, None]
+    return lons, lats
+
+
+def make_folded_swath(n_i=200, n_j=20):
+    """
+    Create coordinates of a swath that folds back onto itself.
+    """
+    t = np.linspace(0, 1, n_i)[:, None]
+    lats = 40 * np.sin(np.pi * t) + np.linspace(0, 3, n_j)[None]
+    lons = np.linspace(0, 10, n_j)[None] + 0 * t
+    return lons, lats
+
+
+def make_antimeridian_swath():
+    """
+    Create coordinates of a swath crossing the antimeridian.
+    """
+    lons, lats = make_swath(170, -20, 20)
+    return (lons + 180) % 360 - 180, lats
+
+
+SWATHS = {
+    "regular": make_swath(20, -30, 30),
+    "folded": make_folded_swath(),
+    "pole": make_swath(-40, 40, 80),
+    "antimeridian": make_antimeridian_swath(),
+}
+
+
+@pytest.mark.parametrize("swath", SWATHS.keys())
+@pytest.mark.parametrize("m", [3, 10, 25])
+def test_parse_swath(swath, m):
+    """
+    Ensure that the geometry returned by 'parse_swath' matches the unary
+    union of the swath's tiles.
+    """
+    lons, lats = SWATHS[swath]
+    geometry = parse_swath(lons, lats, m=m)
+    reference = parse_swath_reference(lons, lats, m=m)
+    assert geometry.is_valid
+    assert geometry.symmetric_difference(reference).area < 1e-6 * reference.area
+
+
+def test_handle_poles_overlapping_tiles():
+    """
+    Ensure that overlapping tiles, for which the coverage union yields an
+    invalid geometry, are merged correctly.
+    """
+    tiles = [box(0, 0, 1, 1), box(1, 0, 2, 1), box(0.5, 0, 1.5, 1)]
+    geometry = handle_poles(tiles)
+    assert geometry.is_valid
+    assert geometry.symmetric_difference(box(0, 0, 2, 1)).area < 1e-12